@@ -16,11 +16,15 @@ class JsonApiException(exceptions.APIException):
 
 
 class ManyExceptions(JsonApiException):
-    """ Exception that takes a list of other exceptions """
+    """ Exception that takes an iterable of other exceptions
+
+    They're stored as a tuple since they're only ever iterated
+    once collected.
+    """
 
     def __init__(self, excs):
         super().__init__()
-        self.excs = excs
+        self.excs = tuple(excs)
 
     @property
     def status_code(self):
@@ -34,9 +38,9 @@ class ManyExceptions(JsonApiException):
         codes = [exc.status_code for exc in self.excs]
         same = all(code == codes[0] for code in codes)
 
-        if not same and codes[0].startswith('4'):
+        if not same and codes[0] // 100 == 4:
             return 400
-        elif not same and codes[0].startswith('5'):
+        elif not same and codes[0] // 100 == 5:
             return 500
         return codes[0]
 
@@ -192,7 +196,7 @@ class FieldError(ValidationError):
         if field.startswith('/'):
             self.source = {'pointer': field}
         else:
-            self.source = {'pointer': '/data/attributes/%s' % field}
+            self.source = {'pointer': '/data/attributes/' + field}
         super().__init__(*args, **kwargs)
 
 
@@ -204,7 +208,7 @@ class RelationshipError(ValidationError):
     def __init__(self, field, *args, **kwargs):
         """ Initialize the default message """
 
-        self.source = {'pointer': '/data/relationships/%s' % field}
+        self.source = {'pointer': '/data/relationships/' + field}
         super().__init__(*args, **kwargs)
 
 
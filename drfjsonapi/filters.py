@@ -121,21 +121,29 @@ class JsonApiIncludeFilter(JsonApiBackend, BaseFilterBackend):
         return self.apply_filter(queryset, include)
 
     def apply_filter(self, queryset, include):
-        """ Return a filtered queryset for the query params """
+        """ Return a filtered queryset for the query params
 
+        Each include is prefetched in a single query per relation
+        so `to_representation` walks the related models from the
+        prefetch cache instead of querying once per primary model.
+        Nothing to prefetch means no reason to clone the queryset.
+        """
+
+        if not include:
+            return queryset
         return queryset.prefetch_related(*include)
 
     def to_internal_value(self, request):
         """ Return the sanitized `include` query parameters
 
         Handles comma separated & multiple include params & returns
-        a tuple of duplicate free strings
+        a frozenset of strings so serializers get O(1) membership
+        tests when deciding which related fields to render.
         """
 
         include = request.query_params.getlist('include')
         include = (name.split(',') for name in include)
-        include = list(itertools.chain(*include))
-        return tuple(set(include))
+        return frozenset(itertools.chain.from_iterable(include))
 
     def to_representation(self, serializer, context=None):
         """ Return the JSON API include array """
@@ -148,26 +156,28 @@ class JsonApiIncludeFilter(JsonApiBackend, BaseFilterBackend):
         if not include or not serializer.instance:
             return []
 
-        # uniqifies duplicate serializers & models by using
-        # the serializer as a key & set as value
-        icache = {v: set() for k, v in self.fields.items()}
         models = _to_set(serializer.instance)
 
-        for model in models:
-            for field in include:
-                cache_set = icache[self.fields[field]]
-                cache_set.update(_to_set(_get_relationship(model, field)))
-
-        # prune dupes in the include cache that are also present
-        # in the primary data.
-        _class = serializer.__class__
-        if _class in icache:
-            icache[_class] = icache[_class].difference(models)
-
-        return [
-            serializer(context=context).to_representation(model)
-            for serializer, models in icache.items() for model in models
-        ]
+        # resource identifiers already present in the primary data
+        # or the include array. Checked before serializing so each
+        # unique resource is only ever serialized once.
+        primary = getattr(serializer, 'child', serializer)
+        seen = {(primary.rtype, model.pk) for model in models}
+        included = []
+
+        # declaration order keeps the include array stable
+        for field, serializer_class in self.fields.items():
+            if field not in include:
+                continue
+            related = serializer_class(context=context)
+            rtype = related.rtype
+            for model in models:
+                for _model in _to_set(_get_relationship(model, field)):
+                    key = (rtype, _model.pk)
+                    if key not in seen:
+                        seen.add(key)
+                        included.append(related.to_representation(_model))
+        return included
 
     def validate(self, include):
         """ Hook to validate the coerced include """
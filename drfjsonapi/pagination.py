@@ -58,9 +58,13 @@ class LimitOffsetPagination(JsonApiPagination, _LimitOffsetPagination):
     offset_query_param = 'page[offset]'
 
     def get_first_link(self):
-        """ Return the URL of the first paginated page """
+        """ Return the URL of the first paginated page
 
-        if not self.get_previous_link():
+        Same condition as `get_previous_link` without building
+        (then discarding) the previous URL.
+        """
+
+        if self.offset <= 0:
             return None
 
         return remove_query_param(
@@ -69,9 +73,13 @@ class LimitOffsetPagination(JsonApiPagination, _LimitOffsetPagination):
         )
 
     def get_last_link(self):
-        """ Return the URL of the last paginated page """
+        """ Return the URL of the last paginated page
+
+        Same condition as `get_next_link` without building
+        (then discarding) the next URL.
+        """
 
-        if not self.get_next_link():
+        if self.offset + self.limit >= self.count:
             return None
 
         return replace_query_param(
@@ -20,10 +20,26 @@ from .renderers import JsonApiRenderer
 from .schemas import RELATIONSHIP_LINKAGE_SCHEMA, RESOURCE_OBJECT_SCHEMA
 
 
+_VALIDATORS = {}
+
+
+def _get_validator(schema: dict) -> Draft4Validator:
+    """ Return a cached validator for the schema
+
+    Schemas are module or class level constants so build the
+    validator once per schema instead of once per request.
+    """
+
+    validator = _VALIDATORS.get(id(schema))
+    if validator is None or validator.schema is not schema:
+        validator = _VALIDATORS[id(schema)] = Draft4Validator(schema)
+    return validator
+
+
 def _validate_body(body: dict, schema: dict) -> None:
     """ Raise an InvalidBody exception if non-compliant with the spec """
 
-    errors = Draft4Validator(schema).iter_errors(body)
+    errors = _get_validator(schema).iter_errors(body)
     error = best_match(errors)
     if error:
         exc = InvalidBody(error.message)
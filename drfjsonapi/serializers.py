@@ -9,7 +9,7 @@
 """
 
 from django.core.exceptions import ImproperlyConfigured
-from django.urls import NoReverseMatch, reverse
+from django.urls import NoReverseMatch
 from django.utils.functional import cached_property
 from rest_framework import exceptions
 from rest_framework.relations import ManyRelatedField
@@ -21,6 +21,34 @@ from .exceptions import (
     RtypeConflict,
 )
 from .relations import JsonApiRelatedField
+from .utils import _reverse_pk
+
+
+def _flatten(init):
+    """ Flatten embedded data types
+
+    For embedded field types like a JSONField go through
+    & convert the error key to a '/' separated string
+    flattening them into a single dict.
+
+    This allows for proper pointers in the error object.
+
+    An explicit stack of item iterators is used instead of
+    recursion so keys keep the same depth-first order.
+    """
+
+    ret = {}
+    stack = [('', iter(init.items()))]
+    while stack:
+        lkey, items = stack[-1]
+        for rkey, val in items:
+            if isinstance(val, dict):
+                stack.append((lkey + rkey + '/', iter(val.items())))
+                break
+            ret[lkey + rkey] = val
+        else:
+            stack.pop()
+    return ret
 
 
 class IncludePerfMixin:
@@ -42,9 +70,9 @@ class IncludePerfMixin:
 
         if not kwargs.get('data'):
             include = self.context.get('include', ())
-            for name in self._related_field_names:
-                if name not in include:
-                    self.fields[name].write_only = True
+            fields = self.fields
+            for name in self._related_field_name_set.difference(include):
+                fields[name].write_only = True
 
 
 class JsonApiSerializerMixin:
@@ -61,9 +89,27 @@ class JsonApiSerializerMixin:
             if isinstance(field, (JsonApiRelatedField, ManyRelatedField))
         ]
 
-    @property
+    @cached_property
+    def _related_field_name_set(self):
+        """ Return related field names for O(1) membership tests """
+
+        return frozenset(self._related_field_names)
+
+    @cached_property
+    def _related_view_names(self):
+        """ Return a dict of related field names to their view names """
+
+        return {
+            name: ('%s-%s' % (self.rtype, name)).replace('_', '-')
+            for name in self._related_field_names
+        }
+
+    @cached_property
     def rtype(self) -> str:
-        """ Return the string resource type as referenced by JSON API """
+        """ Return the string resource type as referenced by JSON API
+
+        Cached since it's read for every resource serialized.
+        """
 
         try:
             return self.Meta.rtype
@@ -83,17 +129,15 @@ class JsonApiSerializerMixin:
             jsonapi.org/format/#document-resource-object-relationships
         """
 
-        relationships = {}
-        for name in self._related_field_names:
-            related_view = '%s-%s' % (self.rtype, name)
-            related_view = related_view.replace('_', '-')
-            relationships[name] = {
-                'links': {
-                    'related': reverse(related_view, args=(data['id'],))
-                },
-            }
-            if name in data:
-                relationships[name]['data'] = data.pop(name)
+        rid = data['id']
+        relationships = {
+            name: {'links': {'related': _reverse_pk(related_view, rid)}}
+            for name, related_view in self._related_view_names.items()
+        }
+
+        # only the rendered related fields have linkage
+        for name in relationships.keys() & data.keys():
+            relationships[name]['data'] = data.pop(name)
         return relationships
 
     def _process_validation_errors(self, exc):
@@ -114,44 +158,25 @@ class JsonApiSerializerMixin:
         different renderers.
         """
 
-        def _flatten(init, lkey=''):
-            """ Recursively flatten embedded data types
-
-            For embedded field types like a JSONField go through
-            & convert the error key to a '/' separated string
-            flattening them into a single dict.
-
-            This allows for proper pointers in the error object
-            """
-
-            ret = {}
-            for rkey, val in init.items():
-                key = lkey + rkey
-                if isinstance(val, dict):
-                    ret.update(_flatten(val, key + '/'))
-                else:
-                    ret[key] = val
-            return ret
-
-        excs = []
         if isinstance(exc.detail, list):
-            for error in exc.detail:
-                excs.append(ResourceError(error))
+            excs = [ResourceError(error) for error in exc.detail]
         else:
-            # prune the dict of all related field errors
-            for field in list(exc.detail):
-                for error in exc.detail[field]:
-                    if field in self._related_field_names:
-                        excs.append(RelationshipError(field, error))
-                        del exc.detail[field]
+            # split related field errors from all the others
+            related = self._related_field_name_set
+            excs, detail = [], {}
+            for field, errors in exc.detail.items():
+                if field in related:
+                    excs += [RelationshipError(field, error) for error in errors]
+                else:
+                    detail[field] = errors
 
             # only field errors left now
-            for field, errors in _flatten(exc.detail).items():
-                for error in errors:
-                    if field == 'non_field_errors':
-                        excs.append(ResourceError(error))
-                    else:
-                        excs.append(FieldError(field, error))
+            excs += [
+                ResourceError(error) if field == 'non_field_errors'
+                else FieldError(field, error)
+                for field, errors in _flatten(detail).items()
+                for error in errors
+            ]
 
         raise ManyExceptions(excs)
 
@@ -166,8 +191,9 @@ class JsonApiSerializerMixin:
     def to_internal_value(self, data):
         """ DRF override for better error handling """
 
-        if data['type'] != self.rtype:
-            raise RtypeConflict(given=data['type'], rtype=self.rtype)
+        given, rtype = data.get('type'), self.rtype
+        if given != rtype:
+            raise RtypeConflict(given=given, rtype=rtype)
         return super().to_internal_value(data)
 
     def to_representation(self, instance):
@@ -177,16 +203,23 @@ class JsonApiSerializerMixin:
         """
 
         data = super().to_representation(instance)
+        rtype = self.rtype
+
+        # leaf resources have nothing to build relationships from
+        if self._related_field_names:
+            relationships = self._to_representation_relationships(data)
+        else:
+            relationships = {}
 
         try:
-            links = {'self': reverse(self.rtype + '-detail', args=[instance.pk])}
+            links = {'self': _reverse_pk(rtype + '-detail', instance.pk)}
         except (AttributeError, NoReverseMatch):
             links = {}
 
         return {
             'attributes': data,
             'links': links,
-            'relationships': self._to_representation_relationships(data),
-            'type': self.rtype,
+            'relationships': relationships,
+            'type': rtype,
             'id': str(data.pop('id')),
         }
@@ -5,7 +5,17 @@
     Private & probably shady helper utilities
 """
 
+from urllib.parse import quote
+
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Model
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
+from django.utils.http import RFC3986_SUBDELIMS
+from django.utils.translation import get_language
+
+
+_URL_SENTINEL = '1234567890'
+_URL_TEMPLATES = {}
 
 
 def _get_relationship(model, field_name):
@@ -18,8 +28,16 @@ def _get_relationship(model, field_name):
 
     Because of all that, this handles ToMany's, ForeigKey's
     & OneToOne fields.
+
+    Prefetched ToMany's are read straight from the models prefetch
+    cache which skips building a related manager per call.
     """
 
+    try:
+        return model._prefetched_objects_cache[field_name]
+    except (AttributeError, KeyError):
+        pass
+
     try:
         return getattr(model, field_name).all()
     except ObjectDoesNotExist:
@@ -29,11 +47,52 @@ def _get_relationship(model, field_name):
 
 
 def _to_set(obj):
-    """ Given an object wrap it in a set """
+    """ Given an object wrap it in a set
+
+    Single models are the common case when walking to-one
+    relationships so they're checked for before trying to
+    iterate the object.
+    """
+
+    if obj is None:
+        return set()
+    elif isinstance(obj, Model):
+        return {obj}
 
     try:
         return set(obj)
     except TypeError:
-        if obj is None:
-            return set()
-        return set((obj,))
+        return {obj}
+
+
+def _reverse_pk(view_name, pk):
+    """ Return the same URL as `reverse(view_name, args=(pk,))`
+
+    Reversing walks the URL resolver on every call even though
+    only the pk differs between resources of the same view. So
+    the view is reversed once with a sentinel pk & the URL split
+    around it to build every other URL with concatenation.
+
+    Views whose pattern won't accept the sentinel always fall
+    back to `reverse`. Templates are cached per urlconf, script
+    prefix & active language since all change the reversed URL.
+    """
+
+    key = (get_urlconf(), get_script_prefix(), get_language(), view_name)
+    try:
+        template = _URL_TEMPLATES[key]
+    except KeyError:
+        try:
+            template = reverse(view_name, args=(_URL_SENTINEL,))
+            template = template.split(_URL_SENTINEL)
+        except NoReverseMatch:
+            template = None
+        if template is not None and len(template) != 2:
+            template = None
+        _URL_TEMPLATES[key] = template
+
+    if template is None:
+        return reverse(view_name, args=(pk,))
+
+    pk = quote(str(pk), safe=RFC3986_SUBDELIMS + '/~:@')
+    return template[0] + pk + template[1]
@@ -5,12 +5,18 @@
     Custom views mostly for consistent exception handling
 """
 
-import traceback
-
-from django.core.exceptions import ObjectDoesNotExist, PermissionDenied, ValidationError
+import logging
+import uuid
+
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ObjectDoesNotExist,
+    PermissionDenied,
+    ValidationError,
+)
+from django.db.models import ForeignKey
 from django.http import Http404
-from django.urls import resolve, reverse
-from django.utils.crypto import get_random_string
+from django.urls import get_urlconf, resolve, reverse
 from rest_framework import exceptions
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
@@ -30,21 +36,60 @@ from .pagination import LimitOffsetPagination
 from .parsers import JsonApiResourceParser
 
 
+logger = logging.getLogger(__name__)
+
+_VIEW_CLASSES = {}
+
+
 def _get_error(exc):
-    """ Same order as error members documented in JSON API """
+    """ Same order as error members documented in JSON API
+
+    Only APIException's get here so `detail` & `status_code` are
+    always present. The title falls back to the string of the
+    exception which is only built when there isn't one.
+    """
+
+    try:
+        title = exc.title
+    except AttributeError:
+        title = str(exc)
 
     return {
-        'id': get_random_string(),
+        'id': uuid.uuid4().hex,
         'links': {'about': getattr(exc, 'link', '')},
         'status': str(exc.status_code),
         'code': getattr(exc, 'code', exc.__class__.__name__),
-        'title': getattr(exc, 'title', str(exc)),
-        'detail': getattr(exc, 'detail', str(exc)),
+        'title': title,
+        'detail': exc.detail,
         'source': getattr(exc, 'source', {'pointer': ''}),
         'meta': getattr(exc, 'meta', {}),
     }
 
 
+def _get_pk_fk_attname(instance, field):
+    """ Return the column name if the field is a ForeignKey to the related pk
+
+    None is returned for any other field.
+    """
+
+    try:
+        model_field = instance._meta.get_field(field)
+    except FieldDoesNotExist:
+        return None
+    if isinstance(model_field, ForeignKey) and model_field.target_field.primary_key:
+        return model_field.attname
+    return None
+
+
+def _get_field_error(errors, error):
+    """ Return the first message of nested errors or the error itself """
+
+    try:
+        return str(errors[error][0])
+    except (KeyError, TypeError):
+        return error
+
+
 def _get_errors(response, exc):
     """ Set the root 'errors' key of the exception(s)
 
@@ -53,9 +98,8 @@ def _get_errors(response, exc):
     requires an 'errors' root key with an array.
     """
 
-    response.data = {'errors': []}
-    for _exc in getattr(exc, 'excs', [exc]):
-        response.data['errors'].append(_get_error(_exc))
+    excs = getattr(exc, 'excs', (exc,))
+    response.data = {'errors': [_get_error(_exc) for _exc in excs]}
     return response
 
 
@@ -72,28 +116,21 @@ def jsonapi_exception_handler(exc, context):
     elif isinstance(exc, PermissionDenied):
         exc = exceptions.PermissionDenied(str(exc))
     elif isinstance(exc, exceptions.ValidationError):
-        excs = ManyExceptions([])
-        for field, errors in exc.detail.items():
-            for error in errors:
-                try:
-                    error = str(errors[error][0])
-                except (KeyError, TypeError):
-                    pass
-                excs.excs.append(FieldError('/' + field, error))
-        exc = excs
+        exc = ManyExceptions(
+            FieldError('/' + field, _get_field_error(errors, error))
+            for field, errors in exc.detail.items()
+            for error in errors
+        )
     elif isinstance(exc, ValidationError) and hasattr(exc, 'message_dict'):
-        excs = ManyExceptions([])
-        for field, errors in exc.message_dict.items():
-            for error in errors:
-                excs.excs.append(FieldError(field, error))
-        exc = excs
+        exc = ManyExceptions(
+            FieldError(field, error)
+            for field, errors in exc.message_dict.items()
+            for error in errors
+        )
     elif isinstance(exc, ValidationError):
-        excs = ManyExceptions([])
-        for error in exc.messages:
-            excs.excs.append(ResourceError(error))
-        exc = excs
+        exc = ManyExceptions(ResourceError(error) for error in exc.messages)
     elif not isinstance(exc, exceptions.APIException):
-        traceback.print_exc()  # print it
+        logger.exception('Unhandled exception')
         exc = InternalError()
 
     response = exception_handler(exc, context)
@@ -126,8 +163,15 @@ class JsonApiViewMixin:
     def _get_related_view(self, view_name, action, kwargs=None):
         """ Return the related view instance & check global perms """
 
-        view = resolve(reverse(view_name, kwargs=kwargs))
-        view = view.func.cls(
+        # the view class doesn't depend on the pk so only resolve once
+        key = (get_urlconf(), view_name)
+        try:
+            view_class = _VIEW_CLASSES[key]
+        except KeyError:
+            view = resolve(reverse(view_name, kwargs=kwargs))
+            view_class = _VIEW_CLASSES[key] = view.func.cls
+
+        view = view_class(
             action=action,
             format_kwarg=self.format_kwarg,
             kwargs=kwargs,
@@ -140,6 +184,9 @@ class JsonApiViewMixin:
     def get_included(self, serializer):
         """ Return the list of included resource objects """
 
+        if not getattr(self.request, 'jsonapi_include', None):
+            return []
+
         context = {'request': self.request, 'view': self}
         for backend in self.filter_backends:
             if issubclass(backend, JsonApiIncludeFilter):
@@ -150,7 +197,7 @@ class JsonApiViewMixin:
         """ DRF override to inform serializers which related fields to include """
 
         context = super().get_serializer_context()
-        context['include'] = getattr(self.request, 'jsonapi_include', ())
+        context['include'] = getattr(self.request, 'jsonapi_include', frozenset())
         return context
 
     def render_related_view(self, field, view_name):
@@ -158,11 +205,25 @@ class JsonApiViewMixin:
 
         NOTE: If it's a OneToOneField a DoesNotExist exception
               is thrown.
+
+        A ForeignKey to the related pk has it in the local column
+        so the related model isn't fetched only to be fetched again
+        by the related view.
         """
 
         try:
+            instance = self.get_object()
+            attname = _get_pk_fk_attname(instance, field)
+            if attname:
+                pk = getattr(instance, attname)
+            else:
+                pk = getattr(getattr(instance, field), 'pk', None)
+
+            if pk is None:
+                return Response(None)
+
             view = self._get_related_view(view_name, 'retrieve', kwargs={
-                'pk': getattr(self.get_object(), field),
+                'pk': pk,
             })
             return view.retrieve(self.request)
         except (Http404, ObjectDoesNotExist):